@@ -1,35 +1,285 @@
 # -*- coding: utf-8 -*-
-import os, traceback
+import importlib.util, os, string, sys, threading, traceback
+import numpy as np
 import pandas as pd
-from datetime import timedelta
+from datetime import date, timedelta
+from typing import Optional
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
 EXCLUDE_GROUP = "线上运营组"
 TIME_WINDOW_HOURS = 24  # 邻接配对时间窗口（小时）
+READ_ONLY_EXTS = (".xlsx", ".xlsm")  # 可用 openpyxl 只读流式读取的格式
+# 空白字符删除表（与正则 \s 等价；U+3000 以上无空白字符）
+_WS_DELETE = dict.fromkeys(i for i in range(0x3001) if chr(i).isspace())
+# 表头清洗表：全角空格/不换行空格 -> 空格，去掉回车换行
+_HEADER_TABLE = str.maketrans({"\u3000": " ", "\xa0": " ", "\r": "", "\n": ""})
+_NUMBER_PREFIX_CHARS = string.ascii_letters + "：: "  # 主叫号码前缀字符（TEL: 等）
+# 开始时间的常见固定格式：按首个非空值探测一次，命中即走固定格式解析
+START_TIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M")
+OUTPUT_FORMATS = ("xlsx", "csv", "parquet")  # 导出格式：xlsx 便于人工查看，csv/parquet 写出更快
+FILTER_COLS = ["呼入技能组", "接听技能组", "坐席分机", "坐席姓名"]  # 任一为空即过滤
+
+
+def _cell_to_str(v):
+    """单元格值转字符串，与 pd.read_excel(dtype=str) 结果保持一致（空单元格/错误值为 NaN）。"""
+    if v is None or v == "" or (isinstance(v, float) and v != v):
+        return np.nan
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    if isinstance(v, date):
+        return str(pd.Timestamp(v))
+    return str(v)
+
+
+def _clean_col(c):
+    """清洗表头空白/换行。"""
+    return str(c).translate(_HEADER_TABLE).strip()
+
+
+def _row_prefilter(header):
+    """
+    按表头构造逐行预过滤函数（与 process_excel 的过滤规则一致），读取时即丢弃无效行；
+    缺少过滤列时返回 None（不预过滤，交由后续列校验报错）。
+    """
+    cols = [_clean_col(h) for h in header]
+    if any(c not in cols for c in FILTER_COLS):
+        return None
+    idx = [cols.index(c) for c in FILTER_COLS]
+    i_in = cols.index("呼入技能组")
+
+    def keep(r):
+        for i in idx:
+            v = r[i] if i < len(r) else None  # 行尾空单元格已被裁掉
+            if not isinstance(v, str) or not v.translate(_WS_DELETE):
+                return False
+        return r[i_in].translate(_WS_DELETE) != EXCLUDE_GROUP
+    return keep
+
+
+def _dedup_header(header_raw):
+    """
+    表头：空列名 -> “Unnamed: i”，重复列名 -> “名.1”、“名.2”…；
+    与 pandas python 解析器规则一致（避开已存在的名字，空列名最后处理）。
+    """
+    cols, unnamed = [], []
+    for i, h in enumerate(header_raw):
+        name = _cell_to_str(h)
+        if name is np.nan:
+            name = f"Unnamed: {i}"
+            unnamed.append(i)
+        cols.append(name)
+
+    counts = {}
+    for i in [i for i in range(len(cols)) if i not in unnamed] + unnamed:
+        col = old_col = cols[i]
+        cur_count = counts.get(col, 0)
+        while cur_count > 0:
+            counts[old_col] = cur_count + 1
+            col = f"{old_col}.{cur_count}"
+            if col in cols:
+                cur_count += 1
+            else:
+                cur_count = counts.get(col, 0)
+        cols[i] = col
+        counts[col] = cur_count + 1
+    return cols
+
+
+def _trim_row(r):
+    """裁掉行尾空单元格（None/空串；错误值不算空），同 pandas。"""
+    r = list(r)
+    while r and (r[-1] is None or r[-1] == ""):
+        r.pop()
+    return r
+
+
+def _rows_to_frame(rows):
+    """
+    原始行迭代器 -> DataFrame：跳过第1行，第2行为表头，其余为数据，逐行预过滤；
+    不构建中间的整表 DataFrame。
+    结果按 pd.read_excel(header=1, dtype=str) 的规则转换：整数浮点、日期、错误值（#N/A 等）为 NaN、
+    空/重复表头、末尾空行；各行先裁掉行尾空单元格，列数取表头与数据行的最大宽度，
+    故仅有格式、无值的尾部单元格不会多出 “Unnamed: k” 空列。
+    已知差异：时长单元格为 str(timedelta)（如 “1:00:00”，同 pandas 3；pandas 2 为 “0 days 01:00:00”）；
+    数字表头为字符串（pandas 保留为数字，process_excel 清洗表头时本就统一转为 str）；
+    第1行（标题行）比表头更宽时不补 “Unnamed” 空列（pandas 会补）；不处理多级表头。
+    """
+    next(rows, None)
+    header_raw = _trim_row(next(rows, None) or ())
+
+    keep = _row_prefilter([_cell_to_str(h) for h in header_raw])
+    width = len(header_raw)
+    data = []
+    for r in rows:
+        r = [_cell_to_str(v) for v in _trim_row(r)]
+        width = max(width, len(r))  # 被预过滤的行也计入宽度（同 pandas 读取整表）
+        if keep is None or keep(r):
+            data.append(r)
+
+    # 去掉末尾空行（同 pandas）
+    while data and not data[-1]:
+        data.pop()
+    header = _dedup_header(header_raw + [None] * (width - len(header_raw)))
+    data = [r + [np.nan] * (width - len(r)) if len(r) < width else r for r in data]
+    return pd.DataFrame.from_records(data, columns=header)
+
+
+def _read_xlsx_read_only(input_path: str):
+    """openpyxl 只读模式逐行读取首个工作表；不加载整个工作簿 DOM，内存占用与文件大小相当。"""
+    import openpyxl
+    wb = openpyxl.load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        ws.reset_dimensions()  # 不信任声明的表格范围（仅有格式的空单元格会撑大范围），同 pandas
+        # 逐单元格读取以保留 data_type：错误值（#N/A 等）为 NaN，同 pandas
+        rows = ([np.nan if c.data_type == "e" else c.value for c in row] for row in ws.iter_rows())
+        return _rows_to_frame(rows)
+    finally:
+        wb.close()
+
+
+def _read_calamine(input_path: str):
+    """python-calamine（Rust）流式读取首个工作表；支持 xlsx/xlsm/xls/xlsb。"""
+    from python_calamine import CalamineWorkbook
+    wb = CalamineWorkbook.from_path(input_path)
+    try:
+        ws = wb.get_sheet_by_index(0)
+        rows = ws.iter_rows()
+        # iter_rows 从第1行起，但列从首个非空列起算：补齐前导空列（同 pandas）
+        start_col = ws.start[1] if ws.start else 0
+        if start_col:
+            rows = ([None] * start_col + r for r in rows)
+        return _rows_to_frame(iter(rows))
+    finally:
+        wb.close()
+
+
+def _parse_start_time(s):
+    """
+    解析开始时间列：用首个非空值探测固定格式后整列按该格式解析（免逐行格式推断）；
+    有行不符合该格式时整列回退到自动推断（同原逻辑）。无法解析者为 NaT。
+    """
+    s = pd.Series(s, copy=False).reset_index(drop=True)
+    first = s.dropna()
+    first = first.iloc[0] if len(first) else None
+    fmt = None
+    for f in START_TIME_FORMATS:
+        try:
+            pd.to_datetime(first, format=f)
+        except (TypeError, ValueError):
+            continue
+        fmt = f
+        break
+    if fmt is None:
+        return pd.to_datetime(s, errors="coerce")
+
+    t = pd.to_datetime(s, format=fmt, errors="coerce", cache=True)
+    if (t.isna() & s.notna()).any():
+        return pd.to_datetime(s, errors="coerce")
+    return t
+
+
+def _adjacent_pair_mask(codes, times, window):
+    """
+    已按 (codes, times) 排序的 int64 数组上做一次顺序扫描（以分组边界代替 groupby）：
+    相邻两行号码相同（且非缺失 -1）、时间差 <= window 即成对（times 与 window 同一时间单位）。
+    返回长度 n-1 的布尔数组。
+    """
+    boundary = codes[1:] != codes[:-1]  # 号码分组边界
+    return ~boundary & (codes[1:] >= 0) & (np.diff(times) <= window)
+
 
+def write_xlsx_fast(path: str, header, rows_iter):
+    """
+    openpyxl 只写模式逐行写出 xlsx：不构建 Cell 对象，内存占用恒定。
+    NaN/NA 写为空单元格（同 DataFrame.to_excel）。
+    """
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(list(header))
+    for r in rows_iter:
+        ws.append([None if v is pd.NA or (isinstance(v, float) and v != v) else v for v in r])
+    wb.save(path)
+
+
+def _check_output_format(output_format: str):
+    """校验导出格式及其依赖（parquet 需要 pyarrow），在读取前尽早报错。"""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"不支持的导出格式：{output_format}，可选：{list(OUTPUT_FORMATS)}")
+    if output_format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise ValueError("导出 parquet 需要安装 pyarrow。") from None
 
-def process_excel(input_path: str, output_dir: str):
+
+def write_output(path: str, df_rows, output_format: str = "xlsx"):
+    """
+    按导出格式写出 df_rows（列名即表头）：xlsx 只写模式 / csv（utf-8-sig，Excel 可直接打开）/ parquet（zstd）。
+    output_format 须已经 _check_output_format 校验。
+    """
+    if output_format == "xlsx":
+        write_xlsx_fast(path, df_rows.columns, df_rows.to_numpy(dtype=object).tolist())
+    elif output_format == "csv":
+        df_rows.to_csv(path, index=False, encoding="utf-8-sig")
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        pq.write_table(pa.Table.from_pandas(df_rows, preserve_index=False), path,
+                       compression="zstd", use_dictionary=True)
+
+
+def process_excel(input_path: str, output_dir: Optional[str] = None, write: bool = True,
+                  output_format: str = "xlsx"):
     """
     读取 Excel（第2行为表头，dtype=str 保护大数字），清洗列名；
     过滤：呼入/接听技能组/坐席分机/坐席姓名 任一为空或 NaN，或 呼入技能组=“线上运营组” 的行；
     同一主叫号码内按开始时间做【邻接配对】（相邻两通且 <=24h）；
     导出仅包含源表整行原样数据（不新增任何列），分别写入“没跨组/跨组”文件。
+    write=False 时仅统计对数，不生成任何文件（预览/试运行）；output_format 可选 xlsx/csv/parquet。
     返回：(没跨组对数, 跨组对数)
     """
+    if write and not output_dir:
+        raise ValueError("未指定输出目录（write=True 时必须提供 output_dir）。")
+    if write:
+        _check_output_format(output_format)
+
     # 1) 读第2行为表头；全列按字符串读取
+    #    优先 calamine 流式读取，其次 openpyxl 只读模式，读取时即预过滤无效行
+    readers = []
     try:
-        df_str = pd.read_excel(input_path, engine="openpyxl", header=1, dtype=str)
-    except Exception:
+        import python_calamine  # noqa: F401
+        readers.append(_read_calamine)
+    except ImportError:
+        pass
+    if os.path.splitext(input_path)[1].lower() in READ_ONLY_EXTS:
+        readers.append(_read_xlsx_read_only)
+
+    df_str = None
+    for reader in readers:
+        try:
+            df_str = reader(input_path)
+            break
+        except Exception:
+            # 读取失败不致命，但需留下记录：否则转换逻辑的问题会被静默回退掩盖
+            print(f"{reader.__name__} 读取失败，改用下一种读取方式：", file=sys.stderr)
+            traceback.print_exc()
+            df_str = None
+    if df_str is None:  # 均不可用或读取失败时回退
         df_str = pd.read_excel(input_path, header=1, dtype=str)
 
     # 清洗表头空白/换行
-    def _clean_col(c):
-        s = str(c).replace("\u3000", " ").replace("\xa0", " ")
-        s = s.replace("\r", "").replace("\n", "").strip()
-        return s
     df_str.columns = [_clean_col(c) for c in df_str.columns]
 
+    # 有 pyarrow 时转为 Arrow 字符串列：连续缓冲区存放，省去逐个 Python str 对象开销
+    try:
+        import pyarrow  # noqa: F401
+        df_str = df_str.astype("string[pyarrow]")
+    except ImportError:
+        pass
+
     # 2) 列校验（必须存在）
     REQUIRED_COLS = ["开始时间", "主叫号码", "接听技能组", "呼入技能组", "坐席分机", "坐席姓名"]
     missing = [c for c in REQUIRED_COLS if c not in df_str.columns]
@@ -38,12 +288,11 @@ def process_excel(input_path: str, output_dir: str):
 
     # 3) 规范化 & 过滤（在字符串表上进行，保证导出原样）
     # 主叫号码去掉可能的前缀（TEL: 等）
-    df_str["主叫号码"] = df_str["主叫号码"].astype(str).str.replace(r"^[A-Za-z：: ]+", "", regex=True).str.strip()
+    df_str["主叫号码"] = df_str["主叫号码"].str.lstrip(_NUMBER_PREFIX_CHARS).str.strip()
 
     # 去空白字符 -> 统一为空串判定
-    for col in ["呼入技能组", "接听技能组", "坐席分机", "坐席姓名"]:
-        df_str[col] = df_str[col].astype(str).str.replace(r"\s+", "", regex=True)
-        df_str[col] = df_str[col].where(df_str[col].str.lower() != "nan", "")  # 防“nan”字符串
+    for col in FILTER_COLS:
+        df_str[col] = df_str[col].fillna("").str.translate(_WS_DELETE)
 
     # 过滤：任一为空/NaN 或 呼入技能组 = 线上运营组
     df_str = df_str[
@@ -52,57 +301,56 @@ def process_excel(input_path: str, output_dir: str):
         (df_str["坐席分机"] != "") &
         (df_str["坐席姓名"] != "") &
         (df_str["呼入技能组"] != EXCLUDE_GROUP)
-    ].copy()
+    ].reset_index(drop=True)  # 布尔索引已生成新表，无需再整表 copy
+
+    # 4) 仅取配对所需列做编码、时间解析与排序（均为 ndarray，不影响 df_str 的原样文本）
+    #    接听/呼入技能组按共享词表编码为整数，跨组判定即整数比较
+    skill_codes, _ = pd.factorize(pd.concat([df_str["接听技能组"], df_str["呼入技能组"]], ignore_index=True))
+    n = len(df_str)
+    listen_codes, incoming_codes = skill_codes[:n], skill_codes[n:]
 
-    # 4) 创建处理副本做时间解析与排序（不影响 df_str 的原样文本）
-    df_proc = df_str.copy()
-    df_proc["_rowid"] = range(len(df_proc))  # 绑定原样行位置，后续反查 df_str
-    df_proc["开始时间"] = pd.to_datetime(df_proc["开始时间"], errors="coerce")
-    if df_proc["开始时间"].isna().any():
+    start_time = _parse_start_time(df_str["开始时间"])
+    if start_time.isna().any():
         raise ValueError("存在无法解析的‘开始时间’，请检查时间格式。")
-    df_proc.sort_values(["主叫号码", "开始时间"], inplace=True, kind="stable")
-    df_proc.reset_index(drop=True, inplace=True)
-
-    # 5) 邻接配对：同号码相邻两通且 <= 24 小时
-    pairs = []  # 元组：(标签, rowid_a, rowid_b)
-    for number, g in df_proc.groupby("主叫号码", sort=False):
-        g = g.sort_values("开始时间", kind="stable").reset_index(drop=True)
-        for i in range(len(g) - 1):
-            a_time = g.loc[i, "开始时间"]
-            b_time = g.loc[i + 1, "开始时间"]
-            if (b_time - a_time) <= pd.Timedelta(hours=TIME_WINDOW_HOURS):
-                rid_a = int(g.loc[i, "_rowid"])
-                rid_b = int(g.loc[i + 1, "_rowid"])
-                cross = (str(g.loc[i, "接听技能组"]) != str(g.loc[i + 1, "呼入技能组"]))
-                pairs.append(("跨组" if cross else "没跨组", rid_a, rid_b))
+    # 保持 to_datetime 返回的时间单位（pandas 3 为 us）：强转 ns 会让 1677–2262 年以外的时间溢出；
+    # 经 pandas 取整数（asi8，带时区时为 UTC），带时区的值同样适用
+    unit = start_time.dt.unit
+    times = start_time.array.asi8
+
+    # 主叫号码先编码为整数（sort=True 保持原字符串序），再按 (号码, 时间) 做整数 lexsort（稳定）
+    codes, _ = pd.factorize(df_str["主叫号码"], sort=True)
+    order = np.lexsort((times, codes))  # order[k]：排序后第 k 行在 df_str 中的行位置（rowid）
+    codes = codes[order]
+    times = times[order]
+
+    # 5) 邻接配对：同号码相邻两通且 <= 24 小时（已按 号码+时间 排序，相邻行即可判定，无需 groupby）
+    window = int(np.timedelta64(TIME_WINDOW_HOURS, "h") // np.timedelta64(1, unit))
+    pair_mask = _adjacent_pair_mask(codes, times, window)  # 第 i 个 True 表示排序后第 i、i+1 行成对
+
+    # 配对以三个等长数组存放（SoA）：A 行 rowid、B 行 rowid、是否跨组
+    rid_a = order[:-1][pair_mask]
+    rid_b = order[1:][pair_mask]
+    cross = listen_codes[rid_a] != incoming_codes[rid_b]
+    n_c = int(np.count_nonzero(cross))
+    n_nc = len(cross) - n_c
+    if not write:
+        return n_nc, n_c
 
     # 6) 仅以“原字符串表 df_str”导出整行（不新增任何列）
-    out_nc = os.path.join(output_dir, "重复来电_没跨组.xlsx")
-    out_c  = os.path.join(output_dir, "重复来电_跨组.xlsx")
-    orig_cols = list(df_str.columns)
-
-    if not pairs:
-        df_str.head(0).to_excel(out_nc, index=False)
-        df_str.head(0).to_excel(out_c, index=False)
-        return 0, 0
+    out_nc = os.path.join(output_dir, f"重复来电_没跨组.{output_format}")
+    out_c  = os.path.join(output_dir, f"重复来电_跨组.{output_format}")
 
-    def pairs_to_original_rows(pairs_subset):
-        rows = []
-        for _, rid_a, rid_b in pairs_subset:
-            rows.append(df_str.iloc[rid_a].to_dict())  # A 行（原样字符串）
-            rows.append(df_str.iloc[rid_b].to_dict())  # B 行（原样字符串）
-        return pd.DataFrame(rows, columns=orig_cols)
+    def pairs_to_original_rows(a, b):
+        # A/B 行交错排列，一次花式索引取出原样字符串行
+        rid = np.empty(2 * len(a), dtype=np.int64)
+        rid[0::2] = a  # A 行
+        rid[1::2] = b  # B 行
+        return df_str.iloc[rid]
 
-    pairs_nc = [p for p in pairs if p[0] == "没跨组"]
-    pairs_c  = [p for p in pairs if p[0] == "跨组"]
+    write_output(out_nc, pairs_to_original_rows(rid_a[~cross], rid_b[~cross]), output_format)
+    write_output(out_c, pairs_to_original_rows(rid_a[cross], rid_b[cross]), output_format)
 
-    df_nc_only = pairs_to_original_rows(pairs_nc)
-    df_c_only  = pairs_to_original_rows(pairs_c)
-
-    df_nc_only.to_excel(out_nc, index=False)
-    df_c_only.to_excel(out_c, index=False)
-
-    return len(pairs_nc), len(pairs_c)
+    return n_nc, n_c
 
 
 # ================== GUI ==================
@@ -164,6 +412,15 @@ class App:
                   activeforeground="#FFFFFF", relief="raised", bd=2, font=("Arial", 13)
                   ).place(x=290, y=200, width=120, height=36)
 
+        # 导出格式（xlsx 便于查看；大数据量可选 csv/parquet，写出更快）
+        self.fmt_var = tk.StringVar(value="xlsx")
+        tk.Label(root, text="导出格式：", bg="#FFFFFF", fg="#000000", font=("Arial", 13)).place(x=440, y=206)
+        formats = [f for f in OUTPUT_FORMATS
+                   if f != "parquet" or importlib.util.find_spec("pyarrow") is not None]  # 无 pyarrow 不提供 parquet
+        fmt_menu = tk.OptionMenu(root, self.fmt_var, *formats)
+        fmt_menu.config(bg="#FFFFFF", fg="#333333", relief="raised", bd=1, font=("Arial", 12))
+        fmt_menu.place(x=530, y=200, width=110, height=36)
+
         self.status = tk.StringVar(value="就绪")
         tk.Label(root, textvariable=self.status, bg="#FFFFFF", fg="#333333", font=("Arial", 11)).place(x=24, y=270)
 
@@ -227,34 +484,49 @@ class App:
         if not (out_dir and os.path.isdir(out_dir)):
             messagebox.showwarning("提示", "请先选择输出文件夹。")
             return
+        self._btn_press(self.btn_run, pressed_bg="#2E6EF7", pressed_fg="#FFFFFF")
+        self.btn_run.config(text="处理中…", state="disabled")
+        self.status.set("处理中…")
+        # 后台线程处理，避免阻塞 Tk 主循环；结果经 root.after 回到主线程
+        fmt = self.fmt_var.get()
+        threading.Thread(target=self._do_work, args=(in_path, out_dir, fmt), daemon=True).start()
+
+    def _do_work(self, in_path, out_dir, fmt):
         try:
-            self._btn_press(self.btn_run, pressed_bg="#2E6EF7", pressed_fg="#FFFFFF")
-            self.btn_run.config(text="处理中…")
-            self.status.set("处理中…"); self.root.update_idletasks()
-
-            n_nc, n_c = process_excel(in_path, out_dir)
-            total = n_nc + n_c
-            if total:
-                ratio_nc = n_nc / total
-                ratio_c = n_c / total
-            else:
-                ratio_nc = ratio_c = 0.0
-
-            messagebox.showinfo(
-                "完成",
-                (f"处理完成！\n\n"
-                 f"没跨组：{n_nc}（{ratio_nc:.1%}）\n"
-                 f"跨组：{n_c}（{ratio_c:.1%}）\n\n"
-                 f"输出目录：\n{out_dir}\n已生成：\n"
-                 f"- 重复来电_没跨组.xlsx\n- 重复来电_跨组.xlsx")
-            )
-            self.status.set("完成")
+            n_nc, n_c = process_excel(in_path, out_dir, output_format=fmt)
         except Exception as e:
             traceback.print_exc()
-            messagebox.showerror("出错了", str(e))
-            self.status.set("出错")
-        finally:
-            self._btn_release(self.btn_run, text="开始处理", released_bg="#34A853", released_fg="#FFFFFF")
+            self.root.after(0, self._on_error, str(e))
+        else:
+            self.root.after(0, self._on_done, n_nc, n_c, out_dir, fmt)
+
+    def _on_done(self, n_nc, n_c, out_dir, fmt):
+        self._finish_run()
+        total = n_nc + n_c
+        if total:
+            ratio_nc = n_nc / total
+            ratio_c = n_c / total
+        else:
+            ratio_nc = ratio_c = 0.0
+
+        self.status.set("完成")
+        messagebox.showinfo(
+            "完成",
+            (f"处理完成！\n\n"
+             f"没跨组：{n_nc}（{ratio_nc:.1%}）\n"
+             f"跨组：{n_c}（{ratio_c:.1%}）\n\n"
+             f"输出目录：\n{out_dir}\n已生成：\n"
+             f"- 重复来电_没跨组.{fmt}\n- 重复来电_跨组.{fmt}")
+        )
+
+    def _on_error(self, msg):
+        self._finish_run()
+        self.status.set("出错")
+        messagebox.showerror("出错了", msg)
+
+    def _finish_run(self):
+        self.btn_run.config(state="normal")
+        self._btn_release(self.btn_run, text="开始处理", released_bg="#34A853", released_fg="#FFFFFF")
 
 
 def main():